@@ -0,0 +1,54 @@
+"""
+Django settings for running the test suite.
+
+Extends the project settings with overrides that only make sense under test.
+"""
+from app.settings import *
+
+
+# Password hashing
+# PBKDF2 is deliberately slow; tests only need hashes that round-trip.
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# Database
+# The suite uses no PostgreSQL-specific features, so an in-memory SQLite
+# database removes the network round-trips and fsyncs of the dev database.
+# Django builds the test database for ':memory:' as a shared-cache
+# in-memory database, and each xdist worker gets its own.
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'OPTIONS': {'timeout': 20},
+    }
+}
+
+
+# Migrations
+# Build the schema for every app straight from the models instead of
+# replaying each migration on startup (and again in every xdist worker).
+# Migrations themselves are applied against PostgreSQL in CI.
+
+class DisableMigrations:
+    """Report that no app has a migrations module"""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+
+# Sessions
+# Keep sessions in signed cookies so client.login()/force_login() never
+# write session rows to the database.
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
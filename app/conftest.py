@@ -0,0 +1,21 @@
+"""
+pytest configuration for the test suite
+"""
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    """Mark tests whose TestCase class declares no databases as no_db"""
+    for item in items:
+        test_class = getattr(item, 'cls', None)
+        if test_class is not None and not getattr(test_class, 'databases', True):
+            item.add_marker(pytest.mark.no_db)
+
+
+@pytest.fixture(scope='session')
+def django_db_setup(request):
+    """Only create the test database when a collected test needs it"""
+    if all(item.get_closest_marker('no_db') for item in request.session.items):
+        return
+
+    request.getfixturevalue('django_db_setup')
@@ -0,0 +1,55 @@
+"""
+Factories for test data
+"""
+from decimal import Decimal
+from functools import lru_cache
+
+import factory
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+
+from core import models
+
+TEST_PASSWORD = 'testpass'
+
+
+@lru_cache(maxsize=None)
+def hashed_test_password():
+    """Hash TEST_PASSWORD once and reuse it for every factory user"""
+    return make_password(TEST_PASSWORD)
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    """Factory for user objects"""
+    email = factory.Sequence(lambda n: f'user{n}@example.com')
+    password = factory.LazyFunction(hashed_test_password)
+
+    class Meta:
+        model = get_user_model()
+
+
+class RecipeFactory(factory.django.DjangoModelFactory):
+    """Factory for recipe objects"""
+    user = factory.SubFactory(UserFactory)
+    title = factory.Faker('sentence')
+    time_minutes = 10
+    price = Decimal('5.00')
+    link = 'https://www.example.com/'
+    description = 'Sample recipe description'
+
+    class Meta:
+        model = models.Recipe
+
+
+def create_recipes(user, specs):
+    """Create one recipe for user per dict of field values in specs
+
+    The rows are inserted with a single INSERT and read back in creation
+    order, so the returned recipes have primary keys on every backend.
+    """
+    models.Recipe.objects.bulk_create(
+        [RecipeFactory.build(user=user, **spec) for spec in specs]
+    )
+    recipes = models.Recipe.objects.filter(user=user).order_by('-id')[:len(specs)]
+
+    return list(reversed(recipes))
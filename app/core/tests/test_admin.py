@@ -2,46 +2,63 @@
 test for the django admin 
 """
 
-from django.test import TestCase
+from django.test import TestCase, RequestFactory
+from django.contrib import admin
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from rest_framework.test import APIClient
+
+from core.tests.factories import UserFactory
+
+User = get_user_model()
 
 class AdminSiteTests(TestCase):
     """test for django admin"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """create user"""
-    
-        self.client = APIClient()
-        self.admin_user = get_user_model().objects.create_superuser(
+        cls.admin_user = UserFactory(
             email = 'admin@example.com',
-            password = 'testpass123'
+            is_staff = True,
+            is_superuser = True
         )
-        self.client.force_login(self.admin_user)
-        self.user = get_user_model().objects.create_user(
+        cls.user = UserFactory(
             email = 'user@example.com',
-            password = 'testpass123',
             name = 'Test user full name'
         )
 
+    def admin_request(self, url):
+        """build a GET request for url made by the admin user"""
+        request = RequestFactory().get(url)
+        request.user = self.admin_user
+
+        return request
+
     def test_users_listed(self):
         """test that users are listed on user page"""
         url = reverse('admin:core_user_changelist')
-        res = self.client.get(url)
+        model_admin = admin.site._registry[User]
+        request = self.admin_request(url)
+        queryset = model_admin.get_queryset(request)
 
-        self.assertContains(res, self.user.name)
-        self.assertContains(res, self.user.email)
+        self.assertIn(self.user, queryset)
+        self.assertLessEqual(
+            {'email', 'name'}, set(model_admin.get_list_display(request))
+        )
     
     def test_user_change_page(self):
         url = reverse('admin:core_user_change', args=[self.user.id])
-        res = self.client.get(url)
+        model_admin = admin.site._registry[User]
+        view = admin.site.admin_view(model_admin.change_view)
+        res = view(self.admin_request(url), str(self.user.id))
         
         self.assertEqual(res.status_code, 200)
         
     def test_create_user_page(self):
         """test that the create user page works"""
         url = reverse('admin:core_user_add')
-        res = self.client.get(url)
+        model_admin = admin.site._registry[User]
+        view = admin.site.admin_view(model_admin.add_view)
+        res = view(self.admin_request(url))
 
         self.assertEqual(res.status_code, 200)
\ No newline at end of file
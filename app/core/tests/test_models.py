@@ -9,12 +9,9 @@ from django.test import TestCase
 from django.contrib.auth import get_user_model
 
 from core import models
+from core.tests.factories import UserFactory
 
-
-def create_user(email='hzdkv@example.com', password='testpass'):
-
-    """create user"""
-    return get_user_model().objects.create_user(email, password)
+User = get_user_model()
 
 
 class ModelTests(TestCase):
@@ -24,7 +21,7 @@ class ModelTests(TestCase):
         """test creating a new user with an email is successful"""
         email = 'ychag@example.com'
         password = 'Testpass123'
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email=email,
             password=password
         )
@@ -37,21 +34,25 @@ class ModelTests(TestCase):
         """test the email for a new user is normalized"""
         sample_email = [
             ['test1@EXAMPLE.com', 'test1@example.com'], 
-            ['ychag@Example.com','ychag@example.com']
+            ['ychag@Example.com','ychag@example.com'],
+            ['TEST3@EXAMPLE.COM', 'TEST3@example.com'],
+            ['test4@example.COM', 'test4@example.com'],
+            ['tëst5@ÉXAMPLE.com', 'tëst5@éxample.com'],
         ]
         for email, expected in sample_email:
-            user = get_user_model().objects.create_user(email, 'test123')
+            with self.subTest(email=email):
+                user = User.objects.create_user(email)
 
-            self.assertEqual(user.email, expected)
+                self.assertEqual(user.email, expected)
 
     def test_new_user_without_email_raises_error(self):
         """test creating user without email raises error"""
         with self.assertRaises(ValueError):
-            get_user_model().objects.create_user(None, 'test123')
+            User.objects.create_user(None, 'test123')
 
     def test_create_new_superuser(self):
         """test creating a new superuser"""
-        user = get_user_model().objects.create_superuser(
+        user = User.objects.create_superuser(
             'ychag@example.com',
             'test123'
         )
@@ -61,10 +62,7 @@ class ModelTests(TestCase):
 
     def test_create_recipe(self):
         """test creating a new recipe"""
-        user = get_user_model().objects.create_user(
-            'ychag@example.com',
-            'test123'
-        )
+        user = UserFactory()
 
         recipe = models.Recipe.objects.create(
             user=user,
@@ -79,7 +77,7 @@ class ModelTests(TestCase):
 
     def test_create_tag(self):
         """test creating a new tag"""
-        user = create_user()
+        user = UserFactory()
 
         tag = models.Tag.objects.create(
             user=user,
@@ -90,7 +88,7 @@ class ModelTests(TestCase):
 
     def test_create_ingredient(self):
         """test creating a new ingredient"""
-        user = create_user()
+        user = UserFactory()
         ingredient = models.Ingredient.objects.create(
             user=user,
             name='Cucumber'
@@ -1,5 +1,6 @@
 """Serializers for recipre APIS"""
 
+from django.core.exceptions import FieldDoesNotExist
 from rest_framework import serializers
 
 from core.models import Recipe, Tag, Ingredient
@@ -34,6 +35,23 @@ class RecipeSerializer(serializers.ModelSerializer):
         model = Recipe
         fields = ('id', 'title', 'time_minutes', 'price', 'link','tags','ingredients')
         read_only_fields = ('id',)
+
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """Load only the columns and relations rendered by this serializer"""
+        opts = cls.Meta.model._meta
+        columns, related = [], []
+        for field in cls().fields.values():
+            try:
+                model_field = opts.get_field(field.source)
+            except FieldDoesNotExist:
+                continue
+            if model_field.many_to_many:
+                related.append(model_field.name)
+            elif model_field.concrete:
+                columns.append(model_field.name)
+
+        return queryset.only(*columns).prefetch_related(*related)
     
     def _get_or_create_tags(self, tags,recipe):
         """handle getting or creating tags"""
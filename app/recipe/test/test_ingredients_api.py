@@ -1,31 +1,25 @@
 """
 Test for the ingredients api
 """
-from decimal import Decimal
-from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.test import TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from core.models import Ingredient, Recipe
-from recipe.serializers import IngredientSerializer
+from core.models import Ingredient
+from core.tests.factories import UserFactory, RecipeFactory
 
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
-
-def create_user(email='envkt@example.com', password='testpass'):
-    """Create a new user"""
-    return get_user_model().objects.create(email=email, password=password)
+INGREDIENT_DETAIL_URL = reverse('recipe:ingredient-detail', args=[0]).replace('/0/', '/{}/')
 
 def detail_url(ingredient_id):
     """Create and return a detail url"""
-    return reverse('recipe:ingredient-detail', args=[ingredient_id])
+    return INGREDIENT_DETAIL_URL.format(ingredient_id)
 
 class PublicIngredientsApiTests(TestCase):
     """Test the publicly available ingredients API"""
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_login_required(self):
         """Test that login is required to access the endpoint"""
@@ -35,35 +29,43 @@ class PublicIngredientsApiTests(TestCase):
 
 class PrivateIngredientsApiTests(TestCase):
     """Tests unauthenticated ingredients API access"""
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
 
     def setUp(self):
-        self.client = APIClient()
-        self.user = create_user()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredient_list(self):
         """Test retrieving a list of ingredients"""
-        Ingredient.objects.create(user=self.user, name='Kale')
-        Ingredient.objects.create(user=self.user, name='Salt')
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Kale'),
+            Ingredient(user=self.user, name='Salt'),
+        ])
 
-        res = self.client.get(INGREDIENTS_URL)
-        ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(ingredients, many=True)
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(
+            [ingredient['id'] for ingredient in res.data],
+            list(Ingredient.objects.order_by('-name').values_list('id', flat=True)),
+        )
 
     def test_ingredients_limited_to_user(self):
         """Test that ingredients for the authenticated user are returned"""
-        user2 = create_user(email='upchh@example.com')
+        user2 = UserFactory()
         Ingredient.objects.create(user=user2, name='Vinegar')
         ingredient = Ingredient.objects.create(user=self.user, name='Tumeric')
         
-        res = self.client.get(INGREDIENTS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(res.data), 1)
-        self.assertEqual(res.data[0]['name'], ingredient.name)
-        self.assertEqual(res.data[0]['id'], ingredient.id)        
+        self.assertListEqual(
+            res.data, [{'id': ingredient.id, 'name': ingredient.name}]
+        )
     
     def test_update_ingredient_successful(self):
         """test updating a ingredient"""
@@ -92,39 +94,25 @@ class PrivateIngredientsApiTests(TestCase):
         """Test filtering ingredients by those assigned to recipes"""
         in1 = Ingredient.objects.create(user=self.user, name='Apples')
         in2 = Ingredient.objects.create(user=self.user, name='Turkey')
-        recipe = Recipe.objects.create(
-            title = 'Apple crumble',
-            time_minutes = 5,
-            price = Decimal('4.5'),
-            user = self.user
-        )
+        recipe = RecipeFactory(user=self.user)
         recipe.ingredients.add(in1)
         
-        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
 
-        s1 = IngredientSerializer(in1)
-        s2 = IngredientSerializer(in2)
-        self.assertIn(s1.data, res.data)
-        self.assertNotIn(s2.data, res.data)
+        returned_ids = {ingredient['id'] for ingredient in res.data}
+        self.assertIn(in1.id, returned_ids)
+        self.assertNotIn(in2.id, returned_ids)
     
     def test_filter_ingredients_assigned_unique(self):
         """return unique ingredients"""
         ing = Ingredient.objects.create(user=self.user, name='Eggs')
         Ingredient.objects.create(user=self.user, name='Cheese')
-        recipe = Recipe.objects.create(
-            title = 'Eggs benedict',
-            time_minutes = 30,
-            price = Decimal('2.0'),
-            user = self.user
-        )
-        recipe2 = Recipe.objects.create(
-            title = 'Coriander eggs on toast',
-            time_minutes = 30,
-            price = Decimal('2.0'),
-            user = self.user
-        )
+        recipe = RecipeFactory(user=self.user)
+        recipe2 = RecipeFactory(user=self.user)
         recipe.ingredients.add(ing)
         recipe2.ingredients.add(ing)
         
-        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
         self.assertEqual(len(res.data), 1)
\ No newline at end of file
@@ -1,47 +1,63 @@
 """ Test for recipe API"""
 
 from decimal import Decimal
-import tempfile
+import io
 import os
 from PIL import Image
 
-from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 
-from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework import serializers, status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 
 from core.models import Recipe, Tag, Ingredient
+from core.tests.factories import (
+    UserFactory,
+    RecipeFactory,
+    create_recipes,
+)
 
-from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
+from recipe.serializers import RecipeDetailSerializer, RecipeSerializer
+from recipe.views import RecipeViewSet
 
 
 
 RECIPES_URL = reverse('recipe:recipe-list')
+RECIPE_DETAIL_URL = reverse('recipe:recipe-detail', args=[0]).replace('/0/', '/{}/')
+RECIPE_UPLOAD_IMAGE_URL = reverse('recipe:recipe-upload-image', args=[0]).replace('/0/', '/{}/')
 
 
-def image_upload_url(recipe_id):
-    """Create and return URL for recipe image upload"""
-    return reverse('recipe:recipe-upload-image', args=[recipe_id])
+def create_jpeg_bytes():
+    """Encode and return a small JPEG image"""
+    buffer = io.BytesIO()
+    Image.new('RGB', (10, 10)).save(buffer, format='JPEG')
+
+    return buffer.getvalue()
 
 
-def create_recipe(user, **params):
-    """Create and return a sample recipe"""
-    defaults = {
-        'title': 'Sample recipe',
-        'time_minutes': 10,
-        'price': 5.00,
-        'link': 'https://www.example.com/',
-        'description': 'Sample recipe description'
-    }
-    defaults.update(params)
+JPEG_BYTES = create_jpeg_bytes()
+
+
+def image_upload_url(recipe_id):
+    """Create and return URL for recipe image upload"""
+    return RECIPE_UPLOAD_IMAGE_URL.format(recipe_id)
 
-    return Recipe.objects.create(user=user, **defaults)
 
 def detail_url(recipe_id):
     """Return recipe detail URL"""
-    return reverse('recipe:recipe-detail', args=[recipe_id])
+    return RECIPE_DETAIL_URL.format(recipe_id)
+
+
+recipe_list_view = RecipeViewSet.as_view({'get': 'list', 'post': 'create'})
+recipe_detail_view = RecipeViewSet.as_view({
+    'get': 'retrieve',
+    'patch': 'partial_update',
+})
 
 
 
@@ -49,9 +65,7 @@ def detail_url(recipe_id):
 
 class PublicRecipeApiTests(TestCase):
     """Test unauthenticated recipe API access"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test that authentication is required"""
@@ -59,49 +73,130 @@ class PublicRecipeApiTests(TestCase):
         
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
+class RecipePrefetchQuerysetTests(SimpleTestCase):
+    """Test the columns and relations serializers ask to load"""
+
+    def test_non_model_fields_skipped(self):
+        """Test method fields and renamed sources map to model fields"""
+        class SummarySerializer(RecipeSerializer):
+            minutes = serializers.IntegerField(source='time_minutes')
+            summary = serializers.SerializerMethodField()
+
+            class Meta(RecipeSerializer.Meta):
+                fields = ('id', 'minutes', 'summary', 'tags')
+
+            def get_summary(self, recipe):
+                return recipe.title
+
+        queryset = SummarySerializer.prefetch_queryset(Recipe.objects.all())
+
+        self.assertEqual(
+            queryset.query.deferred_loading, ({'id', 'time_minutes'}, False)
+        )
+        self.assertEqual(queryset._prefetch_related_lookups, ('tags',))
+
+
 class PrivateRecipeApiTests(TestCase):
     """Test authenticated recipe API access"""
+    client_class = APIClient
+    factory = APIRequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
 
     def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
-            'ychag@example.com',
-            'testpass'
-        )
         self.client.force_authenticate(self.user)
 
+    def call_view(self, view, method, url, data=None, **kwargs):
+        """Call view as the user without going through the middleware"""
+        request = getattr(self.factory, method)(url, data, format='json')
+        force_authenticate(request, user=self.user)
+
+        return view(request, **kwargs)
+
     def test_retrieve_recipes(self):
         """Test retrieving a list of recipes"""
-        create_recipe(user=self.user)
-        create_recipe(user=self.user)
+        create_recipes(self.user, [{}, {}])
 
-        res = self.client.get(RECIPES_URL)
-        recipes = Recipe.objects.all().order_by('-id')
-        serializer = RecipeSerializer(recipes, many=True)
+        with self.assertNumQueries(3):
+            res = self.call_view(recipe_list_view, 'get', RECIPES_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(
+            [recipe['id'] for recipe in res.data],
+            list(Recipe.objects.order_by('-id').values_list('id', flat=True)),
+        )
 
     def test_recipes_limited_to_user(self):
         """Test retrieving recipes for user"""
-        other_user = get_user_model().objects.create_user(
-            'envkt@example.com',
-            'testpass'
-        )
-        create_recipe(user=other_user)
-        create_recipe(user=self.user)
-        res = self.client.get(RECIPES_URL)
-        recipes = Recipe.objects.filter(user=self.user)
-        serializer = RecipeSerializer(recipes, many=True)
+        other_user = UserFactory()
+        Recipe.objects.bulk_create([
+            RecipeFactory.build(user=other_user),
+            RecipeFactory.build(user=self.user),
+        ])
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(
+            [recipe['id'] for recipe in res.data],
+            list(
+                Recipe.objects.filter(user=self.user)
+                .order_by('-id').values_list('id', flat=True)
+            ),
+        )
     
+    def test_recipe_list_constant_queries(self):
+        """Test listing recipes does not query once per recipe"""
+        def create_recipe_with_tags():
+            recipe = RecipeFactory(user=self.user)
+            for i in range(3):
+                recipe.tags.add(Tag.objects.create(user=self.user, name=f'Tag {i}'))
+
+        create_recipe_with_tags()
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(RECIPES_URL)
+
+        for _ in range(9):
+            create_recipe_with_tags()
+        with self.assertNumQueries(len(single)):
+            res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 10)
+
+    def test_recipe_list_loads_listed_fields_only(self):
+        """Test listing recipes does not load detail-only columns"""
+        RecipeFactory(user=self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(RECIPES_URL)
+
+        recipe_sql = queries.captured_queries[0]['sql']
+        self.assertIn('"title"', recipe_sql)
+        self.assertNotIn('"description"', recipe_sql)
+        self.assertNotIn('"image"', recipe_sql)
+
+    def test_token_user_resolved_once(self):
+        """Test token authentication looks the user up once per request"""
+        create_recipes(self.user, [{}, {}])
+        token = Token.objects.create(user=self.user)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        with self.assertNumQueries(4):
+            res = client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 2)
+
     def test_get_recipe_detail(self):
         """Test get recipe detail"""
 
-        recipe = create_recipe(user=self.user)
+        recipe = RecipeFactory(user=self.user)
         
         url = detail_url(recipe.id)
-        res = self.client.get(url)
+        with self.assertNumQueries(3):
+            res = self.call_view(recipe_detail_view, 'get', url, pk=recipe.id)
 
         serializer = RecipeDetailSerializer(recipe)
         self.assertEqual(res.data, serializer.data)
@@ -120,7 +215,6 @@ class PrivateRecipeApiTests(TestCase):
         recipe = Recipe.objects.get(id=res.data['id'])
         for key, value in payload.items():
             self.assertEqual(getattr(recipe, key),value)
-        self.assertEqual(recipe.title, payload['title'])
 
     def test_create_recipe_with_tags(self):
         """test creating a recipe with tags"""
@@ -130,18 +224,13 @@ class PrivateRecipeApiTests(TestCase):
             'price': Decimal(5.50),
             'tags': [{'name': 'Vegan'},{'name': 'Dessert'}]
         }
-        res = self.client.post(RECIPES_URL, payload,format='json')
+        res = self.call_view(recipe_list_view, 'post', RECIPES_URL, payload)
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipe = Recipe.objects.filter(user=self.user,)
-        self.assertEqual(recipe.count(), 1)
-        recipe = recipe.first()
-        self.assertEqual(recipe.tags.count(), 2)
-        for tag in payload['tags']:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+        recipe = Recipe.objects.prefetch_related('tags').get(user=self.user)
+        self.assertListEqual(
+            sorted((tag.name, tag.user_id) for tag in recipe.tags.all()),
+            sorted((tag['name'], self.user.id) for tag in payload['tags']),
+        )
 
     def test_create_recipe_with_exist_tags(self):
         """test creating a recipe with exist tags"""
@@ -154,59 +243,82 @@ class PrivateRecipeApiTests(TestCase):
             'tags': [{'name': 'Vegan'},{'name': 'Indian'}]
         }
 
-        res = self.client.post(RECIPES_URL, payload,format='json')
+        res = self.call_view(recipe_list_view, 'post', RECIPES_URL, payload)
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipe = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipe.count(), 1)
-        recipe = recipe.first()
-        self.assertEqual(recipe.tags.count(), 2)
-        self.assertIn(tag_indian, recipe.tags.all())
-        for tag in payload['tags']:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-            ).exists()
-        
-        self.assertTrue(exists)
+        recipe = Recipe.objects.prefetch_related('tags').get(user=self.user)
+        tags = recipe.tags.all()
+        self.assertIn(tag_indian, tags)
+        self.assertListEqual(
+            sorted((tag.name, tag.user_id) for tag in tags),
+            sorted((tag['name'], self.user.id) for tag in payload['tags']),
+        )
     
-    def test_create_tag_on_update(self):
-        """Test creating tag update"""
-        recipe = create_recipe(user=self.user)
-        
-        payload = {'tags': [{'name': 'Vegan'}]}
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload,format='json')
+    def assert_related_created_on_update(self, relation, model):
+        """Check patching relation with a new name creates and assigns it"""
+        recipe = RecipeFactory(user=self.user)
+
+        payload = {relation: [{'name': 'Vegan'}]}
+        res = self.call_view(
+            recipe_detail_view, 'patch', detail_url(recipe.id), payload, pk=recipe.id
+        )
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        new_tag = Tag.objects.get(user=self.user, name='Vegan')
-        self.assertIn(new_tag, recipe.tags.all())
+        new_obj = model.objects.get(user=self.user, name='Vegan')
+        self.assertIn(new_obj, getattr(recipe, relation).all())
+
+    def assert_related_replaced_on_update(self, relation, model):
+        """Check patching relation replaces the assigned objects"""
+        breakfast = model.objects.create(user=self.user, name='Breakfast')
+        recipe = RecipeFactory(user=self.user)
+        getattr(recipe, relation).add(breakfast)
+
+        lunch = model.objects.create(user=self.user, name='Lunch')
+        payload = {relation: [{'name': 'Lunch'}]}
+        res = self.call_view(
+            recipe_detail_view, 'patch', detail_url(recipe.id), payload, pk=recipe.id
+        )
 
-    def test_update_recipre_assigned_tag(self):
-        """Test updating a recipe with assigned tag"""
-        tag_breakfast = Tag.objects.create(user=self.user, name='Breakfast')
-        recipe = create_recipe(user=self.user)
-        recipe.tags.add(tag_breakfast)
-        
-        tag_lunch = Tag.objects.create(user=self.user, name='Lunch')
-        payload = {'tags': [{'name': 'Lunch'}]}
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload,format='json')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        related = getattr(recipe, relation).all()
+        self.assertIn(lunch, related)
+        self.assertNotIn(breakfast, related)
+
+    def assert_related_cleared_on_update(self, relation, model):
+        """Check patching relation with an empty list clears it"""
+        obj = model.objects.create(user=self.user, name='Breakfast')
+        recipe = RecipeFactory(user=self.user)
+        getattr(recipe, relation).add(obj)
+
+        payload = {relation: []}
+        res = self.call_view(
+            recipe_detail_view, 'patch', detail_url(recipe.id), payload, pk=recipe.id
+        )
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertIn(tag_lunch, recipe.tags.all())
-        self.assertNotIn(tag_breakfast, recipe.tags.all())
-    
+        self.assertEqual(getattr(recipe, relation).count(), 0)
+
+    def test_create_tag_on_update(self):
+        """Test creating tag when updating a recipe"""
+        self.assert_related_created_on_update('tags', Tag)
+
+    def test_create_ingredient_on_update(self):
+        """Test creating an ingredient when updating a recipe"""
+        self.assert_related_created_on_update('ingredients', Ingredient)
+
+    def test_update_recipre_assigned_tag(self):
+        """Test assigning an existing tag when updating a recipe"""
+        self.assert_related_replaced_on_update('tags', Tag)
+
+    def test_update_recipe_with_ingredients(self):
+        """Test assigning an existing ingredient when updating a recipe"""
+        self.assert_related_replaced_on_update('ingredients', Ingredient)
+
     def test_clear_recipe_tags(self):
-        """test clear recipe tags"""
-        tag = Tag.objects.create(user=self.user, name='Breakfast')
-        recipe = create_recipe(user=self.user)
-        recipe.tags.add(tag)
-        
-        payload = {'tags': []}
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload,format='json')
+        """Test clearing a recipe's tags"""
+        self.assert_related_cleared_on_update('tags', Tag)
 
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(recipe.tags.count(), 0)
+    def test_clear_recipe_ingredients(self):
+        """Test clearing a recipe's ingredients"""
+        self.assert_related_cleared_on_update('ingredients', Ingredient)
 
     def test_create_recipe_with_ingredients(self):
         """Test creating recipe with ingredients"""
@@ -220,20 +332,20 @@ class PrivateRecipeApiTests(TestCase):
                 {'name': 'Thai'}
             ]
         }
-        res = self.client.post(RECIPES_URL, payload,format='json')
+        res = self.call_view(recipe_list_view, 'post', RECIPES_URL, payload)
         
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipe = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipe.count(), 1)
-        recipe = recipe.first()
-        self.assertEqual(recipe.ingredients.count(), 3)
-        for ingredient in payload['ingredients']:
-
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+        recipe = Recipe.objects.prefetch_related('ingredients').get(user=self.user)
+        self.assertListEqual(
+            sorted(
+                (ingredient.name, ingredient.user_id)
+                for ingredient in recipe.ingredients.all()
+            ),
+            sorted(
+                (ingredient['name'], self.user.id)
+                for ingredient in payload['ingredients']
+            ),
+        )
     
     def test_create_recipe_with_ingredients_exist(self):
         """Test creating recipe with ingredients"""
@@ -248,110 +360,84 @@ class PrivateRecipeApiTests(TestCase):
                 {'name': 'Vegan'}
             ]
         }
-        res = self.client.post(RECIPES_URL, payload,format='json')
+        res = self.call_view(recipe_list_view, 'post', RECIPES_URL, payload)
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipe = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipe.count(), 1)
-        recipe = recipe.first()
-        self.assertEqual(recipe.ingredients.count(), 2)
-       
-        for ingredient in payload['ingredients']:
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
-
-    def test_create_ingredient_on_update(self):
-        """Test creating ingredient update"""
-        recipe = create_recipe(user=self.user)
-        
-        payload = {'ingredients': [{'name': 'Vegan'}]}
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload,format='json')
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        new_ingredient = Ingredient.objects.get(user=self.user, name='Vegan')
-        self.assertIn(new_ingredient, recipe.ingredients.all())
-
-    def test_update_recipe_with_ingredients(self):
-        """Test assigning existing ingredient recipe"""
-        ingredient1 = Ingredient.objects.create(user=self.user, name='Prawns')
-        recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(ingredient1)
-
-        ingredient2 = Ingredient.objects.create(user=self.user, name='Ginger')
-        
-        payload = {'ingredients': [{'name': 'Ginger'}]}
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload,format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertIn(ingredient2, recipe.ingredients.all())
-        self.assertNotIn(ingredient1, recipe.ingredients.all())
-
-    def test_clear_recipe_ingredients(self):
-        """clear recipe ingredients"""
-        ingredient = Ingredient.objects.create(user=self.user, name='Prawns')
-        recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(ingredient)
+        recipe = Recipe.objects.prefetch_related('ingredients').get(user=self.user)
+        ingredients = recipe.ingredients.all()
+        self.assertIn(ingredient, ingredients)
+        self.assertListEqual(
+            sorted((obj.name, obj.user_id) for obj in ingredients),
+            sorted((spec['name'], self.user.id) for spec in payload['ingredients']),
+        )
 
-        payload = {'ingredients': []}
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload,format='json')
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(recipe.ingredients.count(), 0)
-        
     def test_filter_recipes_by_tags(self):
         """Test filtering recipes by tags"""
-        recipe1 = create_recipe(user=self.user, title='Thai vegetable curry')
-        recipe2 = create_recipe(user=self.user, title='Aubergine with tahini')
+        recipe1, recipe2, recipe3 = create_recipes(self.user, [
+            {'title': 'Thai vegetable curry'},
+            {'title': 'Aubergine with tahini'},
+            {'title': 'Fish and chips'},
+        ])
         tag1 = Tag.objects.create(user=self.user, name='Vegan')
         tag2 = Tag.objects.create(user=self.user, name='Vegetarian')
-        recipe1.tags.add(tag1)
-        recipe2.tags.add(tag2)
-        recipe3 = create_recipe(user=self.user, title='Fish and chips')
+        Recipe.tags.through.objects.bulk_create([
+            Recipe.tags.through(recipe=recipe1, tag=tag1),
+            Recipe.tags.through(recipe=recipe2, tag=tag2),
+        ])
 
         params = {'tags': f'{tag1.id},{tag2.id}'}
-        res = self.client.get(RECIPES_URL, params)
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL, params)
 
-        s1 = RecipeSerializer(recipe1)
-        s2 = RecipeSerializer(recipe2)
-        s3 = RecipeSerializer(recipe3)
-        self.assertIn(s1.data, res.data)
-        self.assertIn(s2.data, res.data)
-        self.assertNotIn(s3.data, res.data)
+        returned_ids = {recipe['id'] for recipe in res.data}
+        self.assertIn(recipe1.id, returned_ids)
+        self.assertIn(recipe2.id, returned_ids)
+        self.assertNotIn(recipe3.id, returned_ids)
 
     def test_filter_recipes_by_ingredients(self):
         """test filtering recipes by ingredients"""
-        recipe1 = create_recipe(user=self.user, title='Posh beans on toast')
-        recipe2 = create_recipe(user=self.user, title='Chicken cacciatore')
+        recipe1, recipe2, recipe3 = create_recipes(self.user, [
+            {'title': 'Posh beans on toast'},
+            {'title': 'Chicken cacciatore'},
+            {'title': 'Steak and mushrooms'},
+        ])
         ingredient1 = Ingredient.objects.create(user=self.user, name='Feta cheese')
         ingredient2 = Ingredient.objects.create(user=self.user, name='Chicken')
-        recipe1.ingredients.add(ingredient1)
-        recipe2.ingredients.add(ingredient2)
-        recipe3 = create_recipe(user=self.user, title='Steak and mushrooms')
+        Recipe.ingredients.through.objects.bulk_create([
+            Recipe.ingredients.through(recipe=recipe1, ingredient=ingredient1),
+            Recipe.ingredients.through(recipe=recipe2, ingredient=ingredient2),
+        ])
         
         params = {'ingredients': f'{ingredient1.id},{ingredient2.id}'}
-        res = self.client.get(RECIPES_URL, params)
-        s1 = RecipeSerializer(recipe1)
-        s2 = RecipeSerializer(recipe2)
-        s3 = RecipeSerializer(recipe3)
-        self.assertIn(s1.data, res.data)
-        self.assertIn(s2.data, res.data)
-        self.assertNotIn(s3.data, res.data)
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL, params)
+        returned_ids = {recipe['id'] for recipe in res.data}
+        self.assertIn(recipe1.id, returned_ids)
+        self.assertIn(recipe2.id, returned_ids)
+        self.assertNotIn(recipe3.id, returned_ids)
+
+    def test_filter_recipes_matching_several_tags_once(self):
+        """Test a recipe matching more than one filtered tag is listed once"""
+        recipe = RecipeFactory(user=self.user)
+        tag1 = Tag.objects.create(user=self.user, name='Vegan')
+        tag2 = Tag.objects.create(user=self.user, name='Vegetarian')
+        recipe.tags.add(tag1, tag2)
+
+        res = self.client.get(RECIPES_URL, {'tags': f'{tag1.id},{tag2.id}'})
+
+        self.assertEqual([r['id'] for r in res.data], [recipe.id])
         
 
 class RecipeImageUploadTests(TestCase):
     """Test for ImageUpload API"""
+    client_class = APIClient
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.recipe = RecipeFactory(user=cls.user)
+
     def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
-            'dycjh@example.com',
-            'testpass'
-        )
         self.client.force_authenticate(self.user)
-        self.recipe = create_recipe(user=self.user)
 
     def tearDown(self):
         self.recipe.image.delete()
@@ -359,12 +445,9 @@ class RecipeImageUploadTests(TestCase):
     def test_upload_image_to_recipe(self):
 
         url = image_upload_url(self.recipe.id)
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as ntf:
-            img = Image.new('RGB', (10, 10))
-            img.save(ntf, format='JPEG')
-            ntf.seek(0)
-            payload = {'image': ntf}
-            res = self.client.post(url, payload, format='multipart')
+        image = SimpleUploadedFile('image.jpg', JPEG_BYTES, content_type='image/jpeg')
+        payload = {'image': image}
+        res = self.client.post(url, payload, format='multipart')
         
         self.recipe.refresh_from_db()
         self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -1,9 +1,6 @@
 """
 Test for the tags API
 """
-from decimal import Decimal
-
-from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.test import TestCase
 
@@ -11,24 +8,18 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from core.models import *
-from recipe.serializers import TagSerializer
+from core.tests.factories import UserFactory, RecipeFactory
 
 TAGS_URL = reverse('recipe:tag-list')
+TAG_DETAIL_URL = reverse('recipe:tag-detail', args=[0]).replace('/0/', '/{}/')
 
 def detail_url(tag_id):
     """create and return url for tag detail"""
-    return reverse('recipe:tag-detail', args=[tag_id])
-
-
-def create_user(email='hzdkv@example.com', password='testpass'):
-    """Create a new user"""
-    return get_user_model().objects.create_user(email=email, password=password)
+    return TAG_DETAIL_URL.format(tag_id)
 
 class PublicTagsApiTests(TestCase):
     """Test the publicly available tags API"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test that auth is required for retrieving tags"""
@@ -39,34 +30,41 @@ class PublicTagsApiTests(TestCase):
 
 class PrivateTagsApiTests(TestCase):
     """Test the authorized user tags API"""
+    client_class = APIClient
   
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+
     def setUp(self):
-        self.user = create_user()
-        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
         """Test retrieving tags"""
-        Tag.objects.create(user=self.user, name='Vegan')
-        Tag.objects.create(user=self.user, name='Dessert')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='Vegan'),
+            Tag(user=self.user, name='Dessert'),
+        ])
 
-        res = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL)
 
-        tags = Tag.objects.all().order_by('-name')
-        serializer = TagSerializer(tags, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(
+            [tag['id'] for tag in res.data],
+            list(Tag.objects.order_by('-name').values_list('id', flat=True)),
+        )
 
     def test_tags_limited_to_user(self):
         """Test that tags returned are for the authenticated user"""
-        user2 = create_user(email='upchh@example.com')
+        user2 = UserFactory()
         Tag.objects.create(user=user2, name='Fruity')
         tag = Tag.objects.create(user=self.user, name='Comfort Food')
 
-        res = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(res.data), 1)
-        self.assertEqual(res.data[0]['name'], tag.name)
+        self.assertListEqual(res.data, [{'id': tag.id, 'name': tag.name}])
         
     def test_update_tag(self):
         """Test updating a tag"""
@@ -94,39 +92,24 @@ class PrivateTagsApiTests(TestCase):
         """Test that filter_tags_assigned_to_recipe"""
         tag1 = Tag.objects.create(user=self.user, name='Breakfast')
         tag2 = Tag.objects.create(user=self.user, name='Lunch')
-        recipe = Recipe.objects.create(
-            title = 'Coriander eggs on toast',
-            time_minutes = 30,
-            price = Decimal('2.0'),
-            user = self.user
-        )
+        recipe = RecipeFactory(user=self.user)
         recipe.tags.add(tag1)
-        res = self.client.get(TAGS_URL, {'assigned_only': 1})
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL, {'assigned_only': 1})
 
-        s1 = TagSerializer(tag1)
-        s2 = TagSerializer(tag2)
-
-        self.assertIn(s1.data, res.data)
-        self.assertNotIn(s2.data, res.data)
+        returned_ids = {tag['id'] for tag in res.data}
+        self.assertIn(tag1.id, returned_ids)
+        self.assertNotIn(tag2.id, returned_ids)
 
     def test_filter_tags_assigned_unique(self):
         """test filter_tags_assigned_unique"""
         tag = Tag.objects.create(user=self.user, name='Breakfast')
         Tag.objects.create(user=self.user, name='Lunch')
-        recipe = Recipe.objects.create(
-            title = 'Coriander eggs on toast',
-            time_minutes = 30,
-            price = Decimal('2.0'),
-            user = self.user
-        )
-        recipe2 = Recipe.objects.create(
-            title = 'Coriander eggs on toast2',
-            time_minutes = 30,
-            price = Decimal('2.0'),
-            user = self.user
-        )
+        recipe = RecipeFactory(user=self.user)
+        recipe2 = RecipeFactory(user=self.user)
         recipe.tags.add(tag)
         recipe2.tags.add(tag)
         
-        res = self.client.get(TAGS_URL, {'assigned_only': 1})
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL, {'assigned_only': 1})
         self.assertEqual(len(res.data), 1)
\ No newline at end of file
@@ -10,7 +10,7 @@ from rest_framework.routers import DefaultRouter
 from recipe import views
 
 router = DefaultRouter()
-router.register('recipes', views.RecipeViewSet)
+router.register('recipes', views.RecipeViewSet, basename='recipe')
 router.register('tags', views.TagViewSet)
 router.register('ingredients', views.IngredientViewSet)
 